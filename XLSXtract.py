@@ -22,128 +22,448 @@ Email: gglessner@gmail.com
 """
 
 import argparse
+import datetime
+import heapq
+import io
+import multiprocessing
 import os
 import sys
 import warnings
 import shutil
+import signal
+import subprocess
+import tempfile
+from contextlib import closing
+from itertools import chain
+from operator import methodcaller
 from pathlib import Path
 from openpyxl import load_workbook
-from typing import Set, Generator, List, Tuple
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None  # Optional, used by default when installed
+from typing import Set, Generator, Iterable, List, Optional, Tuple
 import time
 import re
+import xml.etree.ElementTree as ET
+import zipfile
+
+# SpreadsheetML element names used by the streaming reader
+NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_SHEET_DATA = NS + 'sheetData'
+NS_ROW = NS + 'row'
+NS_C = NS + 'c'
+NS_V = NS + 'v'
+NS_IS = NS + 'is'
+NS_SI = NS + 'si'
+NS_R = NS + 'r'
+NS_T = NS + 't'
+
+# A shared string entry holding a single plain text element
+SHARED_STRING_RE = re.compile(r'<si><t(?:\s[^>]*)?(?:/>|>([^<]*)</t>)</si>')
+
+# The predefined XML entities and numeric character references
+XML_ENTITY_RE = re.compile(r'&(?:(lt|gt|amp|quot|apos)|#([0-9]+)|#x([0-9a-fA-F]+));')
+XML_ENTITIES = {'lt': '<', 'gt': '>', 'amp': '&', 'quot': '"', 'apos': "'"}
+
+# The type attribute of a shared, formula or inline text cell
+TEXT_CELL_RE = re.compile(rb"""\bt\s*=\s*["'](?:s|str|inlineStr)["']""")
+
+# Bytes read at a time when checking a worksheet for text cells
+SCAN_CHUNK_SIZE = 1 << 20
+
+# Number of temporary files words are spread over in low memory mode
+LOW_MEM_BUCKETS = 256
+
+# Minimum time between progress redraws in seconds (about 30 per second)
+PROGRESS_INTERVAL = 0.033
+
+# Character class searches used by the password complexity check
+HAS_UPPER = re.compile(r'[A-Z]').search
+HAS_LOWER = re.compile(r'[a-z]').search
+HAS_DIGIT = re.compile(r'\d').search
+# Common password special characters: !@#$%^&*()_+-=[]{}|;:,.<>?/~`
+HAS_SPECIAL = re.compile(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?/~`]').search
+
+# Available XLSX readers; auto picks calamine when installed, otherwise openpyxl
+BACKENDS = ('auto', 'openpyxl', 'sax', 'calamine')
+
+# Number of sorted words joined into each write of the final output
+WRITE_BATCH = 1 << 16
+
+# Terminal width cached by get_terminal_width, cleared when the window is resized
+terminal_width = None
 
 # Suppress openpyxl data validation warning
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 
+class UnprintableTable(dict):
+    """str.translate table that deletes non-printable and whitespace characters.
+    Entries are filled in on first lookup, so only characters actually seen are stored."""
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        replacement = None if not char.isprintable() or char.isspace() else codepoint
+        self[codepoint] = replacement
+        return replacement
+
+UNPRINTABLE_OR_SPACE = UnprintableTable()
+
 def is_complex_password(word: str) -> bool:
-    """Check if a word meets password complexity requirements."""
-    has_upper = bool(re.search(r'[A-Z]', word))
-    has_lower = bool(re.search(r'[a-z]', word))
-    has_digit = bool(re.search(r'\d', word))
-    # Common password special characters: !@#$%^&*()_+-=[]{}|;:,.<>?/~`
-    has_special = bool(re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?/~`]', word))
-    return has_upper and has_lower and has_digit and has_special
+    """Check if a word meets password complexity requirements.
+    Replaced by the compiled version from xlsxtract_core when it is available."""
+    # Rarest classes first, so most words are rejected after a single scan
+    return bool(HAS_SPECIAL(word) and HAS_DIGIT(word) and HAS_UPPER(word) and HAS_LOWER(word))
 
 def get_terminal_width() -> int:
-    """Get the width of the terminal window."""
-    try:
-        return shutil.get_terminal_size().columns
-    except:
-        return 80  # Default fallback width
-
-def truncate_for_display(text: str, max_length: int) -> str:
-    """Truncate text to fit terminal width, accounting for the 'Extracting: ' prefix."""
-    prefix = "Extracting: "
-    max_display_length = get_terminal_width() - len(prefix) - 3  # -3 for safety margin
-    if len(text) > max_display_length:
-        return text[:max_display_length] + "..."
-    return text
-
-def find_xlsx_files(directory: str, filename_pattern: str = None) -> Generator[Path, None, None]:
+    """Get the width of the terminal window.
+    The size is queried once and cached until the window is resized."""
+    global terminal_width
+    if terminal_width is None:
+        try:
+            terminal_width = shutil.get_terminal_size().columns
+        except:
+            terminal_width = 80  # Default fallback width
+    return terminal_width
+
+def reset_terminal_width(signum, frame):
+    """SIGWINCH handler: query the terminal size again on next use."""
+    global terminal_width
+    terminal_width = None
+
+def find_xlsx_files(directory: str, filename_pattern: str = None) -> Generator[str, None, None]:
     """Recursively find all .xlsx files in the given directory.
     If filename_pattern is provided, only return files matching that name."""
-    directory_path = Path(directory)
+    wanted_name = None
     if filename_pattern:
+        wanted_name = filename_pattern.lower()
         # If filename_pattern doesn't end with .xlsx, add it
-        if not filename_pattern.lower().endswith('.xlsx'):
-            filename_pattern += '.xlsx'
-        # Return only files matching the exact name
-        return (f for f in directory_path.rglob("*.xlsx") if f.name.lower() == filename_pattern.lower())
-    return directory_path.rglob("*.xlsx")
-
-def print_progress(word: str, word_count: int):
-    """Print progress with word truncation based on terminal width."""
-    terminal_width = get_terminal_width()
-    # Account for the "Extracting: " prefix and some padding
-    max_word_width = terminal_width - 20
-    truncated_word = truncate_for_display(word, max_word_width)
-    # Clear the line and print with carriage return
-    print(f"\rExtracting: {truncated_word} (Found {word_count} words)", end='', flush=True)
-
-def extract_text_from_xlsx(xlsx_path: Path, split_chars: str, max_length: int, show_progress: bool = False, check_complexity: bool = False) -> Tuple[Set[str], int]:
-    """Extract text values from an XLSX file."""
+        if not wanted_name.endswith('.xlsx'):
+            wanted_name += '.xlsx'
+    
+    # Walk with os.scandir, whose entries carry their type without an extra stat call
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue  # Unreadable directory
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    pending.append(entry.path)
+                    continue
+                name = entry.name.lower()
+                if name.endswith('.xlsx') and (wanted_name is None or name == wanted_name):
+                    yield entry.path
+
+def tokenize_cell(text: str, split_words, max_length: int) -> Tuple[List[str], int]:
+    """Split a cell value into cleaned words of at most max_length characters.
+    Returns the words and the number of pieces skipped for being empty or too
+    long after cleaning.
+    Replaced by the compiled version from xlsxtract_core when it is available."""
+    words = []
+    skipped_words = 0
+    
+    if not text or text.isspace():
+        return words, skipped_words
+    
+    # Split into words using specified delimiters
+    for word in (split_words(text) if split_words else (text,)):
+        if not word:
+            continue  # Nothing between adjacent delimiters
+        # Clean the word, which also removes surrounding whitespace
+        if not word.isprintable():
+            word = word.translate(UNPRINTABLE_OR_SPACE)
+        elif ' ' in word:
+            # The plain space is the only printable whitespace, so the cleaned
+            # length is known without copying and removing spaces is all the
+            # cleaning needed
+            if len(word) - word.count(' ') > max_length:
+                skipped_words += 1
+                continue
+            word = word.replace(' ', '')
+        # Length is measured on the cleaned word
+        if not word or len(word) > max_length:
+            skipped_words += 1
+            continue
+        words.append(word)
+    return words, skipped_words
+
+try:
+    # Optional compiled tokenizer, built with: python setup.py build_ext --inplace
+    from xlsxtract_core import tokenize_cell, is_complex_password
+except ImportError:
+    pass
+
+def unescape_xml(match) -> str:
+    """Expand one match of XML_ENTITY_RE."""
+    name, decimal, hexadecimal = match.groups()
+    if name:
+        return XML_ENTITIES[name]
+    return chr(int(decimal) if decimal else int(hexadecimal, 16))
+
+def scan_shared_strings(data: bytes) -> Optional[List[str]]:
+    """Scan a plain shared strings table directly from the raw XML.
+    Returns None if the table needs a real XML parser (rich text, phonetic
+    hints, namespace prefixes or anything else not shaped <si><t>...</t></si>)."""
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return None  # Some other declared encoding
+    entries = SHARED_STRING_RE.findall(text)
+    # Every <si> must have matched, otherwise indexes would shift
+    if len(entries) != text.count('<si') or len(entries) * 2 != text.count('si>'):
+        return None
+    
+    shared_strings = []
+    for entry in entries:
+        # XML end-of-line handling applies to the raw text, before references
+        # are expanded, so &#13; still gives a carriage return
+        if '\r' in entry:
+            entry = entry.replace('\r\n', '\n').replace('\r', '\n')
+        if '&' in entry:
+            references = entry.count('&')
+            try:
+                entry, replaced = XML_ENTITY_RE.subn(unescape_xml, entry)
+            except ValueError:
+                return None  # Character reference out of range
+            if replaced != references:
+                return None  # Not a well-formed reference, leave it to the parser
+        shared_strings.append(entry)
+    return shared_strings
+
+def string_item_text(item: ET.Element) -> str:
+    """Return the value of a string item: a shared string (<si>) or an inline string (<is>)."""
+    # Plain strings hold a single <t>, rich text holds one per run (<r>).
+    # Phonetic hints (<rPh>) are not part of the value.
+    parts = []
+    for child in item:
+        if child.tag == NS_T:
+            parts.append(child.text or '')
+        elif child.tag == NS_R:
+            parts.extend(t.text or '' for t in child.iter(NS_T))
+    return ''.join(parts)
+
+def parse_shared_strings(data: bytes) -> List[str]:
+    """Parse a shared strings table of any shape with ElementTree."""
+    shared_strings = []
+    for _, elem in ET.iterparse(io.BytesIO(data), events=('end',)):
+        if elem.tag == NS_SI:
+            shared_strings.append(string_item_text(elem))
+            elem.clear()
+    return shared_strings
+
+def read_shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    """Read the shared strings table of an XLSX archive into a list."""
+    try:
+        data = archive.read('xl/sharedStrings.xml')
+    except KeyError:
+        return []  # Workbooks without text cells have no table
+    
+    shared_strings = scan_shared_strings(data)
+    if shared_strings is None:
+        shared_strings = parse_shared_strings(data)
+    return shared_strings
+
+def sheet_has_text(archive: zipfile.ZipFile, sheet_name: str) -> bool:
+    """Check whether a worksheet contains any text cell with a raw byte scan,
+    which is far cheaper than parsing sheets that only hold numbers."""
+    tail = b''
+    with archive.open(sheet_name) as source:
+        while True:
+            chunk = source.read(SCAN_CHUNK_SIZE)
+            if not chunk:
+                return False
+            # Also check across the chunk boundary
+            if TEXT_CELL_RE.search(tail + chunk[:64]) or TEXT_CELL_RE.search(chunk):
+                return True
+            tail = chunk[-64:]
+
+def iter_sheet_text(archive: zipfile.ZipFile, sheet_name: str, shared_strings: List[str], seen: Optional[bytearray] = None) -> Generator[str, None, None]:
+    """Stream the text cells of a single worksheet, skipping numeric cells.
+    If seen is given, each shared string is yielded only once and marked in it."""
+    if not sheet_has_text(archive, sheet_name):
+        return
+    
+    sheet_data = None
+    with archive.open(sheet_name) as source:
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == NS_SHEET_DATA:
+                    sheet_data = elem
+                continue
+            if tag == NS_C:
+                cell_type = elem.get('t')
+                if cell_type == 's':
+                    value = elem.find(NS_V)
+                    if value is not None and value.text:
+                        index = int(value.text)
+                        if seen is not None:
+                            if seen[index]:
+                                continue  # Its words were already collected
+                            seen[index] = 1
+                        yield shared_strings[index]
+                elif cell_type == 'inlineStr':
+                    inline = elem.find(NS_IS)
+                    if inline is not None:
+                        yield string_item_text(inline)
+                elif cell_type == 'str':
+                    value = elem.find(NS_V)
+                    if value is not None and value.text:
+                        yield value.text
+            elif tag == NS_ROW and sheet_data is not None:
+                # Detach finished rows so memory is bounded by a single row
+                sheet_data.clear()
+
+def list_worksheets(archive: zipfile.ZipFile) -> List[str]:
+    """Return the worksheet XML members of an XLSX archive."""
+    return [name for name in archive.namelist()
+            if name.startswith('xl/worksheets/sheet') and name.endswith('.xml')]
+
+def iter_cells_openpyxl(xlsx_path: Path, strings_only: bool = False) -> Generator[str, None, None]:
+    """Stream the value of every non-empty cell using openpyxl.
+    With strings_only, numbers, dates and booleans are skipped."""
+    # External link caches are never needed, so skip parsing them
+    workbook = load_workbook(xlsx_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        for sheet in workbook:
+            # Ignore the declared dimension, which some writers set far beyond
+            # the real data, so rows are not padded out to a phantom range
+            if hasattr(sheet, 'reset_dimensions'):
+                sheet.reset_dimensions()
+            # Plain value tuples avoid building a cell object per cell
+            for row in sheet.iter_rows(values_only=True):
+                for value in row:
+                    if type(value) is str:
+                        yield value
+                    elif value is not None and not strings_only:
+                        yield str(value)
+    finally:
+        workbook.close()
+
+def collect_words(cells: Iterable[str], split_words, max_length: int, check_complexity: bool = False, show_progress: bool = False) -> Tuple[Set[str], int, int]:
+    """Collect the unique words found in a stream of cell values."""
     text_values = set()
     word_count = 0
     skipped_words = 0
     
-    try:
-        workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
+    if show_progress:
+        last_progress = 0.0
+    
+    for value in cells:
+        words, skipped = tokenize_cell(value, split_words, max_length)
+        skipped_words += skipped
+        if not words:
+            continue
         
-        for sheet in workbook:
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.value is not None:
-                        # Convert to string and clean
-                        text = str(cell.value).strip()
-                        if not text:
-                            continue
-                            
-                        # Split into words using specified delimiters
-                        words_to_process = []
-                        if split_chars:
-                            # Create a regex pattern that matches any of the split characters
-                            pattern = f"[{re.escape(split_chars)}]+"
-                            words_to_process = re.split(pattern, text)
+        # Skip words that fail the complexity check. Words already collected
+        # passed it before, so only new words are checked.
+        if check_complexity:
+            new_words = [word for word in words if word not in text_values]
+            complex_words = [word for word in new_words if is_complex_password(word)]
+            skipped_words += len(new_words) - len(complex_words)
+            words = complex_words
+            if not words:
+                continue
+        
+        if show_progress and time.monotonic() - last_progress >= PROGRESS_INTERVAL:
+            # Pick a word this cell adds, checked before the words are added
+            new_word = next((word for word in reversed(words) if word not in text_values), None)
+        else:
+            new_word = None
+        
+        # Add the whole cell at once and count new words from the size change
+        known_words = len(text_values)
+        text_values.update(words)
+        word_count += len(text_values) - known_words
+        
+        if new_word is not None:
+            last_progress = time.monotonic()
+            # The width is cached, so this is cheap and still follows resizes
+            max_display_length = get_terminal_width() - len("Extracting: ") - 3  # -3 for safety margin
+            display = new_word if len(new_word) <= max_display_length else new_word[:max_display_length] + "..."
+            # Clear the line and redraw in a single write
+            sys.stdout.write(f"\r\033[KExtracting: {display}")
+            sys.stdout.flush()
+    
+    return text_values, word_count, skipped_words
+
+def iter_cells_calamine(xlsx_path: Path, strings_only: bool = False) -> Generator[str, None, None]:
+    """Stream the value of every non-empty cell using python-calamine.
+    Values are formatted as openpyxl would format them, except that error
+    cells such as #N/A are skipped. With strings_only, numbers, dates and
+    booleans are skipped."""
+    with CalamineWorkbook.from_path(str(xlsx_path)) as workbook:
+        for sheet_name in workbook.sheet_names:
+            for row in workbook.get_sheet_by_name(sheet_name).iter_rows():
+                for value in row:
+                    if type(value) is str:
+                        if value:  # Empty and error cells come back as ''
+                            yield value
+                    elif strings_only:
+                        continue
+                    elif type(value) is float:
+                        # All numbers are reported as floats. Print whole numbers like
+                        # openpyxl, but only where the float holds the integer exactly.
+                        if value.is_integer() and abs(value) < 2 ** 53:
+                            yield str(int(value))
                         else:
-                            words_to_process = [text]
-                        
-                        for word in words_to_process:
-                            word = word.strip()
-                            if not word or len(word) > max_length:
-                                skipped_words += 1
-                                continue
-                                
-                            # Clean the word
-                            word = ''.join(c for c in word if c.isprintable() and not c.isspace())
-                            
-                            # Skip if complexity check fails
-                            if check_complexity and not is_complex_password(word):
-                                skipped_words += 1
-                                continue
-                                
-                            if word and word not in text_values:
-                                text_values.add(word)
-                                word_count += 1
-                                if show_progress:
-                                    print(f"\033[K", end='')  # Clear the line
-                                    print(f"\rExtracting: {truncate_for_display(word, get_terminal_width())}", end='', flush=True)
+                            yield str(value)
+                    elif type(value) is datetime.date:
+                        # Date-only cells come back as dates, openpyxl gives datetimes
+                        yield str(datetime.datetime.combine(value, datetime.time()))
+                    else:
+                        yield str(value)
+
+def extract_text_from_xlsx(xlsx_path: Path, split_chars: str, max_length: int, show_progress: bool = False, check_complexity: bool = False, backend: str = 'openpyxl', strings_only: bool = False) -> Tuple[Set[str], int, int]:
+    """Extract text values from an XLSX file.
+    A file that fails partway through contributes no words."""
+    
+    if not split_chars:
+        split_words = None
+    elif len(set(split_chars)) == 1:
+        # A single delimiter is split on directly, without the regex engine
+        split_words = methodcaller('split', split_chars[0])
+    else:
+        # Compile a regex matching any run of the split characters once per file
+        split_words = re.compile(f"[{re.escape(split_chars)}]+").split
+    
+    try:
+        if backend != 'sax':
+            reader = iter_cells_calamine if backend == 'calamine' else iter_cells_openpyxl
+            # Close the workbook as soon as we are done with it, even on errors
+            with closing(reader(xlsx_path, strings_only)) as cells:
+                text_values, word_count, skipped_words = collect_words(cells, split_words, max_length, check_complexity, show_progress)
+        else:
+            with zipfile.ZipFile(xlsx_path) as archive:
+                shared_strings = read_shared_strings(archive)
+                sheet_names = list_worksheets(archive)
+                # Repeated shared strings give the same words, so tokenize each once
+                seen = bytearray(len(shared_strings))
+                cells = chain.from_iterable(iter_sheet_text(archive, name, shared_strings, seen) for name in sheet_names)
+                text_values, word_count, skipped_words = collect_words(cells, split_words, max_length, check_complexity, show_progress)
         
         if show_progress:
             print()  # New line after done with word display
         
-        workbook.close()
         return text_values, word_count, skipped_words
         
     except Exception as e:
         print(f"\nError processing {xlsx_path}: {str(e)}")
         return set(), 0, 0
 
-def process_xlsx_file(xlsx_path: Path, split_chars: str, show_progress: bool, max_length: int, check_complexity: bool) -> Tuple[Set[str], int]:
+def process_xlsx_file(xlsx_path: Path, split_chars: str, show_progress: bool, max_length: int, check_complexity: bool, backend: str = 'openpyxl', strings_only: bool = False) -> Tuple[Set[str], int, int]:
     """Process a single XLSX file and return the extracted text values."""
     print(f"Processing: {xlsx_path}")
     
     # Extract text from the Excel file
-    text_values, word_count, skipped_words = extract_text_from_xlsx(xlsx_path, split_chars, max_length, show_progress, check_complexity)
+    text_values, word_count, skipped_words = extract_text_from_xlsx(xlsx_path, split_chars, max_length, show_progress, check_complexity, backend, strings_only)
     
     if show_progress:
         print()  # New line after done with word display
@@ -152,7 +472,110 @@ def process_xlsx_file(xlsx_path: Path, split_chars: str, show_progress: bool, ma
         if check_complexity:
             print(f"Skipped {skipped_words} words that didn't meet complexity requirements")
     
-    return text_values, skipped_words
+    return text_values, word_count, skipped_words
+
+class WordBuckets:
+    """Spill words to hash-keyed temporary files instead of holding them in memory.
+    The buckets are sorted on disk by the system sort command when available.
+    Otherwise, since each word always lands in the same bucket, buckets are
+    deduplicated and sorted one at a time and merged into the final output."""
+    
+    def __init__(self, num_buckets: int = LOW_MEM_BUCKETS):
+        self.temp_dir = tempfile.TemporaryDirectory(prefix='xlsxtract-')
+        self.paths = [os.path.join(self.temp_dir.name, f"bucket{i}.txt") for i in range(num_buckets)]
+        self.files = [open(path, 'w', encoding='utf-8') for path in self.paths]
+    
+    def update(self, words: Set[str]):
+        """Append words to their buckets."""
+        files = self.files
+        mask = len(files) - 1
+        for word in words:
+            files[hash(word) & mask].write(f"{word}\n")
+    
+    def update_from_file(self, path: str):
+        """Move the words of a file with one word per line into their buckets, then delete it."""
+        files = self.files
+        mask = len(files) - 1
+        with open(path, encoding='utf-8') as spill_file:
+            for line in spill_file:
+                files[hash(line[:-1]) & mask].write(line)
+        os.remove(path)
+    
+    def write_sorted(self, output_path: str) -> int:
+        """Write all unique words to output_path in sorted order and return how many were written."""
+        for bucket in self.files:
+            bucket.close()
+        
+        if not self.external_sort(output_path):
+            return self.merge_buckets(output_path)
+        
+        with open(output_path, 'rb') as output_file:
+            return sum(chunk.count(b'\n') for chunk in iter(lambda: output_file.read(1 << 20), b''))
+    
+    def external_sort(self, output_path: str) -> bool:
+        """Sort and deduplicate the buckets with the system sort command, which
+        merges on disk in C. Returns False if it is unavailable or failed."""
+        sort_command = shutil.which('sort') if os.name == 'posix' else None
+        if not sort_command:
+            return False
+        # Byte order in the C locale is code point order for UTF-8, the same as sorted()
+        result = subprocess.run([sort_command, '-u', '-T', self.temp_dir.name, '-o', output_path, *self.paths],
+                                env=dict(os.environ, LC_ALL='C'), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+    
+    def merge_buckets(self, output_path: str) -> int:
+        """Sort and deduplicate the buckets in Python and merge them into output_path."""
+        # Deduplicate and sort one bucket at a time, so peak memory is a single bucket
+        sorted_paths = []
+        for path in self.paths:
+            with open(path, encoding='utf-8') as bucket:
+                words = sorted(set(bucket))
+            os.remove(path)
+            sorted_path = path + '.sorted'
+            with open(sorted_path, 'w', encoding='utf-8') as bucket:
+                bucket.writelines(words)
+            sorted_paths.append(sorted_path)
+        
+        # Buckets never share a word, so a plain merge yields unique sorted output
+        unique_count = 0
+        sorted_files = [open(path, encoding='utf-8') for path in sorted_paths]
+        try:
+            with open(output_path, 'w', encoding='utf-8') as output_file:
+                for line in heapq.merge(*sorted_files):
+                    output_file.write(line)
+                    unique_count += 1
+        finally:
+            for bucket in sorted_files:
+                bucket.close()
+        return unique_count
+    
+    def cleanup(self):
+        """Remove the temporary files."""
+        for bucket in self.files:
+            bucket.close()
+        self.temp_dir.cleanup()
+
+def merge_words(all_words: Set[str], words: Set[str]) -> Set[str]:
+    """Merge one file's words into all_words and return the merged set.
+    The smaller set is merged into the larger one, hashing fewer words."""
+    if len(words) > len(all_words):
+        words.update(all_words)
+        return words
+    all_words.update(words)
+    return all_words
+
+def _extract(task: Tuple[Path, str, int, bool, str, bool, Optional[str]]) -> Tuple[Path, object, int, int]:
+    """Worker entry point for parallel extraction of a single XLSX file.
+    Returns the set of words, or when spill_dir is given, the path of a file
+    in it holding one word per line."""
+    xlsx_path, split_chars, max_length, check_complexity, backend, strings_only, spill_dir = task
+    text_values, word_count, skipped_words = extract_text_from_xlsx(xlsx_path, split_chars, max_length, False, check_complexity, backend, strings_only)
+    if spill_dir is not None:
+        # Hand the words over on disk instead of pickling the whole set
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=spill_dir, suffix='.txt', delete=False) as spill_file:
+            spill_file.writelines(f"{word}\n" for word in text_values)
+        return xlsx_path, spill_file.name, word_count, skipped_words
+    return xlsx_path, text_values, word_count, skipped_words
 
 def main():
     parser = argparse.ArgumentParser(description='Extract text from XLSX files for password generation.')
@@ -163,9 +586,20 @@ def main():
     parser.add_argument('-l', '--max-length', type=int, default=32, help='Maximum length of words to extract (default: 32)')
     parser.add_argument('-f', '--filename', help='Only process files with this exact name (e.g., "Config.xlsx")')
     parser.add_argument('-c', '--complexity', action='store_true', help='Only extract words that meet password complexity requirements (uppercase, lowercase, number, and special character)')
+    parser.add_argument('-b', '--backend', choices=BACKENDS, default='auto', help='XLSX reader to use: auto (default, calamine if installed, otherwise openpyxl), openpyxl, sax (built-in streaming reader, only extracts text cells) or calamine (requires python-calamine)')
+    parser.add_argument('--fast', dest='backend', action='store_const', const='sax', help='Shorthand for --backend sax')
+    parser.add_argument('--strings-only', action='store_true', help='Only extract text cells, skipping numbers, dates and booleans')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes to use (default: number of CPUs, or 1 with -p; 1 disables parallel processing)')
+    parser.add_argument('--low-mem', action='store_true', help='Spill words to temporary files instead of keeping them all in memory (slower, for very large inputs)')
     
     args = parser.parse_args()
     
+    if args.backend == 'auto':
+        args.backend = 'calamine' if CalamineWorkbook is not None else 'openpyxl'
+    elif args.backend == 'calamine' and CalamineWorkbook is None:
+        print("Error: the calamine backend requires python-calamine (pip install python-calamine)")
+        return
+    
     # Ensure the directory exists
     if not os.path.isdir(args.directory):
         print(f"Error: Directory '{args.directory}' does not exist")
@@ -175,10 +609,10 @@ def main():
     total_files = 0
     total_words = 0
     total_skipped = 0
-    all_words = set()
+    all_words = WordBuckets() if args.low_mem else set()
     
-    # First pass: collect all words
-    print("First pass: Collecting all words...")
+    # Collect all words, then write them out sorted in one go
+    print("Collecting words...")
     print(f"Maximum word length: {args.max_length} characters")
     if args.split_chars:
         print(f"Split characters: {args.split_chars}")
@@ -186,8 +620,18 @@ def main():
         print(f"Only processing files named: {args.filename}")
     if args.progress:
         print("Showing real-time word extraction (this will be slower)")
+        if hasattr(signal, 'SIGWINCH'):
+            signal.signal(signal.SIGWINCH, reset_terminal_width)
+    if args.backend == 'sax':
+        print("Using the streaming XLSX reader (text cells only)")
+    elif args.backend == 'calamine':
+        print("Using the calamine XLSX reader")
+    if args.strings_only:
+        print("Only extracting text cells")
     if args.complexity:
         print("Checking password complexity (requires uppercase, lowercase, number, and special character)")
+    if args.low_mem:
+        print("Low memory mode: spilling words to temporary files")
     xlsx_files = list(find_xlsx_files(args.directory, args.filename))
     
     if not xlsx_files:
@@ -195,30 +639,72 @@ def main():
             print(f"No files named '{args.filename}' found in {args.directory}")
         else:
             print(f"No XLSX files found in {args.directory}")
+        if args.low_mem:
+            all_words.cleanup()
         return
     
     print(f"Found {len(xlsx_files)} XLSX files")
     
-    # Process each file and collect words
-    for xlsx_path in xlsx_files:
-        words, skipped = process_xlsx_file(xlsx_path, args.split_chars, args.progress, args.max_length, args.complexity)
-        all_words.update(words)
-        total_files += 1
-        total_words += len(words)
-        total_skipped += skipped
+    if args.jobs:
+        num_workers = args.jobs
+    elif args.progress:
+        num_workers = 1  # Real-time word display needs a single process
+    else:
+        num_workers = os.cpu_count() or 1
+    num_workers = min(num_workers, len(xlsx_files))
+    if num_workers > 1:
+        # Workers share stdout, so real-time word display is not available
+        if args.progress:
+            print("Real-time word extraction is disabled when using multiple workers")
+        print(f"Using {num_workers} worker processes")
+        # In low memory mode workers write their words next to the buckets
+        spill_dir = all_words.temp_dir.name if args.low_mem else None
+        tasks = [(xlsx_path, args.split_chars, args.max_length, args.complexity, args.backend, args.strings_only, spill_dir) for xlsx_path in xlsx_files]
+        with multiprocessing.Pool(num_workers) as pool:
+            for xlsx_path, words, word_count, skipped in pool.imap_unordered(_extract, tasks):
+                print(f"Processed [{total_files + 1}/{len(xlsx_files)}]: {xlsx_path}")
+                print(f"Found {word_count} words")
+                if args.complexity:
+                    print(f"Skipped {skipped} words that didn't meet complexity requirements")
+                if args.low_mem:
+                    all_words.update_from_file(words)
+                else:
+                    all_words = merge_words(all_words, words)
+                total_files += 1
+                total_words += word_count
+                total_skipped += skipped
+    else:
+        # Process each file and collect words
+        for xlsx_path in xlsx_files:
+            words, word_count, skipped = process_xlsx_file(xlsx_path, args.split_chars, args.progress, args.max_length, args.complexity, args.backend, args.strings_only)
+            if args.low_mem:
+                all_words.update(words)
+            else:
+                all_words = merge_words(all_words, words)
+            total_files += 1
+            total_words += word_count
+            total_skipped += skipped
     
     # Write final sorted and unique list
     print("\nWriting final sorted and unique word list...")
-    with open(args.output, 'w', encoding='utf-8') as output_file:
-        for word in sorted(all_words):
-            output_file.write(f"{word}\n")
+    if args.low_mem:
+        unique_count = all_words.write_sorted(args.output)
+        all_words.cleanup()
+    else:
+        words = sorted(all_words)
+        with open(args.output, 'w', encoding='utf-8', buffering=1 << 20) as output_file:
+            # Join in batches: few write calls without a second full copy of the words
+            for start in range(0, len(words), WRITE_BATCH):
+                output_file.write("\n".join(words[start:start + WRITE_BATCH]))
+                output_file.write("\n")
+        unique_count = len(all_words)
     
     # Print statistics
     print("\nProcessing complete!")
     print(f"Statistics:")
     print(f"- Files processed: {total_files}")
     print(f"- Total words found: {total_words}")
-    print(f"- Unique words written: {len(all_words)}")
+    print(f"- Unique words written: {unique_count}")
     print(f"- Maximum word length: {args.max_length} characters")
     if args.split_chars:
         print(f"- Split characters: {args.split_chars}")
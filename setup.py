@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+"""
+Build the optional compiled tokenizer used by XLSXtract:
+    python setup.py build_ext --inplace
+
+XLSXtract falls back to its pure Python tokenizer when the extension is not built.
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name='xlsxtract_core',
+    ext_modules=cythonize([Extension('xlsxtract_core', ['xlsxtract_core.pyx'])]),
+)
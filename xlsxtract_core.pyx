@@ -0,0 +1,105 @@
+# cython: language_level=3
+"""
+Compiled tokenizer for XLSXtract
+Copyright (C) 2024 Garland Glessner <gglessner@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Drop-in replacements for XLSXtract.tokenize_cell and
+XLSXtract.is_complex_password. Build with:
+    python setup.py build_ext --inplace
+"""
+
+from cpython.unicode cimport Py_UNICODE_ISDECIMAL, Py_UNICODE_ISPRINTABLE, Py_UNICODE_ISSPACE
+
+# Character class bits for is_complex_password
+cdef enum:
+    UPPER = 1
+    LOWER = 2
+    DIGIT = 4
+    SPECIAL = 8
+    ALL_CLASSES = UPPER | LOWER | DIGIT | SPECIAL
+
+# Class bit of every ASCII character, built once at import
+cdef unsigned char ascii_classes[128]
+cdef int code
+for code in range(128):
+    ascii_classes[code] = 0
+for code in range(ord('A'), ord('Z') + 1):
+    ascii_classes[code] = UPPER
+for code in range(ord('a'), ord('z') + 1):
+    ascii_classes[code] = LOWER
+for code in range(ord('0'), ord('9') + 1):
+    ascii_classes[code] = DIGIT
+# Common password special characters: !@#$%^&*()_+-=[]{}|;:,.<>?/~`
+for code in b'!@#$%^&*()_+-=[]{}|;:,.<>?/~`':
+    ascii_classes[code] = SPECIAL
+
+cpdef bint is_complex_password(str word):
+    """Check if a word meets password complexity requirements.
+    Classifies every character in a single pass and stops once all classes are seen."""
+    cdef Py_UCS4 c
+    cdef unsigned char found = 0
+    for c in word:
+        if c < 128:
+            found |= ascii_classes[c]
+        elif Py_UNICODE_ISDECIMAL(c):
+            found |= DIGIT  # Like the \d in the pure Python check
+        else:
+            continue
+        if found == ALL_CLASSES:
+            return True
+    return False
+
+cdef inline bint keep_char(Py_UCS4 c):
+    """Characters kept in a word: printable and not whitespace."""
+    return Py_UNICODE_ISPRINTABLE(c) and not Py_UNICODE_ISSPACE(c)
+
+cdef str clean_word(str word, Py_ssize_t max_length):
+    """Remove non-printable and whitespace characters from a word in a single
+    pass. Returns None as soon as the cleaned word exceeds max_length."""
+    cdef Py_UCS4 c
+    cdef Py_ssize_t kept = 0
+    cdef bint dirty = False
+    for c in word:
+        if keep_char(c):
+            kept += 1
+            if kept > max_length:
+                return None
+        else:
+            dirty = True
+    if not dirty:
+        return word  # Already clean, no copy needed
+    return ''.join([c for c in word if keep_char(c)])
+
+cpdef tuple tokenize_cell(str text, object split_words, Py_ssize_t max_length):
+    """Split a cell value into cleaned words of at most max_length characters.
+    Returns the words and the number of pieces skipped for being empty or too
+    long after cleaning."""
+    cdef list words = []
+    cdef Py_ssize_t skipped_words = 0
+    cdef str word
+    
+    if not text or text.isspace():
+        return words, skipped_words
+    
+    for word in (split_words(text) if split_words is not None else (text,)):
+        if not word:
+            continue  # Nothing between adjacent delimiters
+        word = clean_word(word, max_length)
+        if not word:
+            skipped_words += 1
+            continue
+        words.append(word)
+    return words, skipped_words